@@ -1,12 +1,22 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 import time
 import json
 import datetime
+import functools
+import gzip
+import hashlib
+import mmap
 import argparse
 from dotenv import load_dotenv
 import os
 import sys
+import threading
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 
 # Load .env config
@@ -18,32 +28,111 @@ if not SLACK_TOKEN:
 
 HEADERS = {'Authorization': f'Bearer {SLACK_TOKEN}'}
 
+# Shared session so every API call reuses pooled keep-alive connections.
+# urllib3 retries server errors with backoff; rate limits are handled by slack_get.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=5, backoff_factor=1, status_forcelist=[500, 502, 503, 504], raise_on_status=False),
+))
+
+# Requests per minute allowed for each Slack API method (https://api.slack.com/apis/rate-limits)
+RATE_LIMITS = {
+    "users.list": 20,             # Tier 2
+    "conversations.info": 50,     # Tier 3
+    "conversations.history": 50,  # Tier 3
+    "conversations.replies": 50,  # Tier 3
+}
+
 # Path for storing user data
 USER_DATA_PATH = Path(os.path.expanduser("~/.slackdown/users.json"))
 
+# Directory for caching conversations.history pages between runs
+PAGE_CACHE_PATH = Path(os.path.expanduser("~/.slackdown/pages"))
+# Cached pages older than this are refetched, since replies, edits and deletions can change them
+PAGE_CACHE_TTL = 24 * 60 * 60
+
 # Constants for JSON to Markdown conversion
 MAX_MSG_LENGTH = 2000
-JIRA_COMMENT_RE = re.compile(r"@?.+ commented on OH-\d+ .+")
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
+# Surrounding whitespace is part of the pattern so message text doesn't need stripping first
+JIRA_COMMENT_RE = re.compile(r"\s*@?\S.* commented on OH-\d+ .*\S\s*")
+MD_ESCAPE = str.maketrans({'*': '\\*', '_': '\\_', '`': '\\`'})
+# Markdown special characters, user mentions, channel references and links, matched in a single pass
+SLACK_MD_RE = re.compile(r"([*_`])|<@([UW][A-Z0-9]+)>|<#C[A-Z0-9]+\|([^>]+)>|<(https?://[^|>]+)(?:\|([^>]+))?>")
+
+# Number of thread reply requests to keep in flight at once
+MAX_WORKERS = 8
 
 def check_response(resp, retry_count=0):
     if not resp.get("ok"):
         error = resp.get("error")
         if error == "ratelimited":
-            # Use the Slack-provided retry_after if available, otherwise use exponential backoff
-            slack_retry = resp.get("retry_after")
-            if slack_retry:
-                retry_after = int(slack_retry)
-            else:
-                # Start with 2 seconds, then exponentially increase: 2, 4, 8, 16, 32...
-                retry_after = 2 * (2 ** retry_count)
-                
-            print(f"⏰ Rate limited by Slack API. Waiting {retry_after} seconds (attempt {retry_count + 1})...")
-            time.sleep(retry_after)
+            # slack_get has already waited out each Retry-After; callers decide whether to try again
+            print(f"⏰ Still rate limited by Slack API (attempt {retry_count + 1})")
             return False
         print("❌ Slack API error:", error)
         raise Exception("Slack API error: " + str(error))
     return True
 
+class RateLimiter:
+    """Token bucket allowing `calls` requests per `period` seconds, shared across threads."""
+
+    def __init__(self, calls, period):
+        self.capacity = calls
+        self.rate = calls / period
+        self.tokens = calls
+        self.updated = time.monotonic()
+        self.resume_at = 0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Block until a request may be sent."""
+        with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.resume_at:
+                    time.sleep(self.resume_at - now)
+                    continue
+
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                time.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds):
+        """Hold back every caller for `seconds`, e.g. as requested by a Retry-After header."""
+        with self.lock:
+            self.resume_at = max(self.resume_at, time.monotonic() + seconds)
+            # Allow one request as soon as the pause lifts, then refill from there so the bucket doesn't burst
+            self.tokens = 1
+            self.updated = self.resume_at
+
+RATE_LIMITERS = {method: RateLimiter(calls, 60) for method, calls in RATE_LIMITS.items()}
+
+def slack_get(method, params, max_retries=5):
+    """Call a Slack API method, pacing requests and waiting out 429s for exactly as long as Slack asks.
+
+    Returns a ratelimited error response if Slack is still returning 429s after max_retries attempts.
+    """
+    limiter = RATE_LIMITERS[method]
+    for attempt in range(max_retries):
+        limiter.wait()
+        res = SESSION.get(f"https://slack.com/api/{method}", params=params)
+        if res.status_code != 429:
+            return res.json()
+
+        retry_after = int(res.headers.get("Retry-After", 1))
+        print(f"⏰ Rate limited by Slack API on {method}. Pausing for {retry_after} seconds (attempt {attempt + 1})...")
+        limiter.pause(retry_after)
+
+    print(f"❌ Still rate limited on {method} after {max_retries} attempts")
+    return {"ok": False, "error": "ratelimited"}
+
 def save_users(user_map, metadata=None):
     """Save user data to local file system."""
     if metadata is None:
@@ -77,6 +166,43 @@ def load_users():
     
     return None, None
 
+def page_cache_path(channel_id, oldest, cursor):
+    key = (cursor or 'start').encode()
+    return PAGE_CACHE_PATH / channel_id / f"{oldest}-{hashlib.blake2b(key, digest_size=16).hexdigest()}.json"
+
+def prune_page_cache(channel_id, oldest):
+    """Delete this channel's cached pages that are expired or were fetched for a different range."""
+    channel_dir = PAGE_CACHE_PATH / channel_id
+    if not channel_dir.is_dir():
+        return
+
+    expires = time.time() - PAGE_CACHE_TTL
+    for cache_path in channel_dir.iterdir():
+        try:
+            if not cache_path.name.startswith(f"{oldest}-") or cache_path.stat().st_mtime < expires:
+                cache_path.unlink()
+        except OSError as e:
+            print(f"⚠️ Failed to prune cached page {cache_path.name}: {e}")
+
+def save_page(cache_path, data):
+    """Atomically save a conversations.history response to the page cache."""
+    cache_path.parent.mkdir(exist_ok=True, parents=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(data))
+    os.replace(tmp_path, cache_path)
+
+def load_page(cache_path):
+    """Load a cached conversations.history response if available."""
+    try:
+        if cache_path.exists():
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except Exception as e:
+        print(f"⚠️ Failed to load cached page {cache_path.name}: {e}")
+
+    return None
+
 def fetch_user_map(force_refresh=False):
     """Get users, using local cache if available unless force_refresh is True."""
     if not force_refresh:
@@ -100,8 +226,7 @@ def fetch_user_map(force_refresh=False):
         retry_count = 0
         
         while retry_count < max_retries:
-            res = requests.get("https://slack.com/api/users.list", headers=HEADERS, params=params)
-            data = res.json()
+            data = slack_get("users.list", params)
             
             if check_response(data, retry_count):
                 break
@@ -121,9 +246,6 @@ def fetch_user_map(force_refresh=False):
         cursor = data.get("response_metadata", {}).get("next_cursor")
         if not cursor:
             break
-        
-        # Respect rate limits - add small delay between pagination requests
-        time.sleep(0.5)
 
     if not user_map:
         print("⚠️ No users fetched. Check your token scopes (`users:read`).")
@@ -136,29 +258,29 @@ def fetch_user_map(force_refresh=False):
 def get_channel_name(channel_id):
     print(f"🔍 Getting channel info for {channel_id}...")
     params = {'channel': channel_id}
-    
-    max_retries = 3
-    retry_count = 0
-    
-    while retry_count < max_retries:
-        res = requests.get("https://slack.com/api/conversations.info", headers=HEADERS, params=params)
-        data = res.json()
-        
-        if check_response(data, retry_count):
-            channel_name = data.get('channel', {}).get('name', channel_id)
-            print(f"📚 Channel name: {channel_name}")
-            return channel_name
-        
-        retry_count += 1
-        if retry_count >= max_retries:
-            print(f"❌ Failed after {max_retries} attempts to get channel info")
-            return channel_id
 
-def fetch_channel_messages(channel_id, oldest):
+    data = slack_get("conversations.info", params)
+
+    if not check_response(data):
+        print("❌ Failed to get channel info")
+        return channel_id
+
+    channel_name = data.get('channel', {}).get('name', channel_id)
+    print(f"📚 Channel name: {channel_name}")
+    return channel_name
+
+def fetch_channel_messages(channel_id, oldest, spool_path, force_refresh=False, on_page=None):
+    """Append channel history to a JSONL spool file, one page per line. Returns the number of messages fetched.
+
+    Every page after the first is cached on disk for up to PAGE_CACHE_TTL so repeated or interrupted
+    exports can skip pages they already have. The first page is always fetched fresh since new
+    messages land there.
+    If given, on_page is called with each page's messages as soon as it arrives.
+    """
     print(f"💬 Fetching messages from channel {channel_id} since {datetime.datetime.fromtimestamp(int(oldest)).date()}...")
-    messages = []
     cursor = None
     total = 0
+    prune_page_cache(channel_id, oldest)
 
     while True:
         params = {
@@ -169,120 +291,175 @@ def fetch_channel_messages(channel_id, oldest):
         if cursor:
             params['cursor'] = cursor
 
+        cache_path = page_cache_path(channel_id, oldest, cursor)
+        data = load_page(cache_path) if cursor and not force_refresh else None
+        cached = data is not None
+
         max_retries = 5
         retry_count = 0
-        success = False
-        
-        has_more = True
+        success = cached
+
         while retry_count < max_retries and not success:
-            res = requests.get("https://slack.com/api/conversations.history", headers=HEADERS, params=params)
-            data = res.json()
-            
+            data = slack_get("conversations.history", params)
+
             if check_response(data, retry_count):
                 success = True
-                batch = data.get("messages", [])
-                total += len(batch)
-                print(f"  ➕ Fetched {len(batch)} messages (total: {total})")
-                messages.extend(batch)
-                
-                cursor = data.get("response_metadata", {}).get("next_cursor")
-                has_more = data.get("has_more", False)
+                if cursor:
+                    save_page(cache_path, data)
             else:
                 retry_count += 1
                 if retry_count >= max_retries:
                     print(f"❌ Failed after {max_retries} attempts to fetch messages")
                     break
-        
+
         if not success:
             break
-            
+
+        # Drop join notices before they reach the spool
+        batch = [msg for msg in data.get("messages", []) if msg.get('subtype') != 'channel_join']
+        total += len(batch)
+        print(f"  ➕ {'Loaded cached' if cached else 'Fetched'} {len(batch)} messages (total: {total})")
+        with open(spool_path, 'a', encoding='utf-8') as spool:
+            spool.write(json.dumps(batch) + "\n")
+        if on_page:
+            on_page(batch)
+
+        cursor = data.get("response_metadata", {}).get("next_cursor")
+
         # If there are no more messages, break the outer loop
-        if not has_more:
+        if not data.get("has_more", False):
             break
-            
-        # Always add a delay between requests to prevent rate limiting
-        time.sleep(1.2)  # Slightly longer delay to be safer with rate limits
 
-    if not messages:
+    if not total:
         print("⚠️ No messages returned. Check channel ID, date range, or bot permissions.")
-    return messages
+    return total
+
+def read_spool(spool_path):
+    """Yield spooled pages oldest first, decoding one page at a time."""
+    if not os.path.getsize(spool_path):
+        return
+
+    with open(spool_path, 'rb') as spool, mmap.mmap(spool.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Slack returns history newest first, so walk the pages backwards from the end of the file
+        end = len(mm) - 1
+        while end > 0:
+            start = mm.rfind(b"\n", 0, end) + 1
+            page = json.loads(mm[start:end])
+            page.reverse()
+            yield page
+            end = start - 1
 
 def fetch_thread(channel_id, thread_ts):
-    print(f"🔁 Fetching thread replies for ts={thread_ts}...")
     params = {'channel': channel_id, 'ts': thread_ts}
-    
-    max_retries = 3
-    retry_count = 0
-    
-    while retry_count < max_retries:
-        res = requests.get("https://slack.com/api/conversations.replies", headers=HEADERS, params=params)
-        data = res.json()
-        
-        if check_response(data, retry_count):
-            replies = data.get("messages", [])[1:]
-            print(f"  ↪️ {len(replies)} replies")
-            return replies
-        
-        retry_count += 1
-        if retry_count >= max_retries:
-            print(f"⚠️ Failed to fetch thread after {max_retries} attempts, skipping thread")
-            return []
-        
-        # Add delay between retries
-        time.sleep(1)
 
-def resolve_user(user_id, user_map):
-    return user_map.get(user_id, f"<@{user_id}>")
+    data = slack_get("conversations.replies", params)
 
-def structure_messages(messages, user_map, channel_id):
-    structured = []
-    print("🧱 Structuring messages...")
+    if not check_response(data):
+        print(f"⚠️ Failed to fetch thread ts={thread_ts}, skipping thread")
+        return []
 
-    for i, msg in enumerate(messages):
-        if msg.get('subtype') == 'channel_join':
-            continue
+    return data.get("messages", [])[1:]
 
-        print(f"🔹 Processing message {i+1}/{len(messages)} | ts={msg['ts']}")
-        entry = {
-            'user': resolve_user(msg.get('user', ''), user_map),
-            'timestamp': datetime.datetime.fromtimestamp(float(msg['ts'])).isoformat(),
-            'text': msg.get('text', ''),
-            'thread': []
-        }
+def prefetch_threads(executor, channel_id, threads, messages):
+    """Start fetching replies for each parent in messages that has them, recording the futures in threads by thread_ts."""
+    for msg in messages:
+        if msg.get('thread_ts') == msg['ts'] and msg.get('reply_count', 0) > 0:
+            threads[msg['ts']] = executor.submit(fetch_thread, channel_id, msg['ts'])
+
+class UserMap(dict):
+    """Maps user IDs to names, falling back to a raw <@ID> mention that is cached for unknown users."""
 
-        if 'thread_ts' in msg and msg['ts'] == msg['thread_ts']:
-            entry['thread'] = fetch_thread(channel_id, msg['thread_ts'])
+    def __missing__(self, user_id):
+        name = self[user_id] = f"<@{user_id}>"
+        return name
 
-        structured.append(entry)
-    return structured
+def structure_message(msg, user_map):
+    return {
+        'user': user_map[msg.get('user', '')],
+        'timestamp': msg['ts'],
+        'text': msg.get('text', ''),
+    }
+
+def structure_messages(spool_path, user_map, threads):
+    """Yield structured top-level messages oldest first, reading history from the spool.
+
+    threads maps thread_ts to a future for that thread's replies, as started by prefetch_threads.
+    Each future is dropped once its replies are consumed.
+    """
+    print("🧱 Structuring messages...")
+    total = 0
+
+    for page in read_spool(spool_path):
+        # Report progress once per page rather than per message to keep terminal output cheap
+        total += len(page)
+        print(f"  🔹 Structuring {len(page)} messages (total: {total})")
+
+        for msg in page:
+            entry = structure_message(msg, user_map)
+            replies = threads.pop(msg['ts']).result() if msg['ts'] in threads else []
+            entry['thread'] = [structure_message(reply, user_map) for reply in replies]
+            yield entry
 
 # Functions from json_to_markdown.py
 
+@functools.lru_cache(maxsize=4096)
+def format_epoch(minute):
+    # Keyed on the minute since that's all TIMESTAMP_FORMAT shows, so bursts of messages share a cached string
+    return datetime.datetime.fromtimestamp(minute).strftime(TIMESTAMP_FORMAT)
+
 def format_timestamp(ts):
     if ts is None:
         return "unknown time"
     try:
         if isinstance(ts, float) or (isinstance(ts, str) and ts.replace(".", "", 1).isdigit()):
-            return datetime.datetime.fromtimestamp(float(ts)).strftime("%Y-%m-%d %H:%M")
-        return datetime.datetime.fromisoformat(str(ts)).strftime("%Y-%m-%d %H:%M")
+            return format_epoch(int(float(ts)) // 60 * 60)
+        return datetime.datetime.fromisoformat(str(ts)).strftime(TIMESTAMP_FORMAT)
     except Exception:
         return str(ts)
 
-def escape_md(text):
-    return text.replace('*', '\\*').replace('_', '\\_').replace('`', '\\`')
-
-def truncate(text, max_len):
-    return text if len(text) <= max_len else text[:max_len] + "..."
+def escape_md(text, user_map=None):
+    """Escape Markdown characters and render Slack mentions, channel references and links."""
+    def replace(match):
+        char, user_id, channel, url, label = match.groups()
+        if char:
+            return '\\' + char
+        if user_id:
+            mention = match.group(0)
+            name = user_map.get(user_id, mention) if user_map is not None else mention
+            return mention if name == mention else '@' + name.translate(MD_ESCAPE)
+        if channel:
+            return '#' + channel.translate(MD_ESCAPE)
+        if label:
+            return f"[{label.translate(MD_ESCAPE)}]({url})"
+        return f"<{url}>"
+
+    return SLACK_MD_RE.sub(replace, text)
+
+def prepare_text(text, user_map=None):
+    """Strip, truncate and escape message text for the transcript in one call."""
+    text = text.strip()
+    if len(text) > MAX_MSG_LENGTH:
+        cut = MAX_MSG_LENGTH
+        # Slack sends literal angle brackets as &lt;/&gt;, so an unclosed < means the cut falls inside
+        # a mention or link; extend it to the closing > so the token still renders
+        if text.rfind('<', 0, cut) > text.rfind('>', 0, cut):
+            close = text.find('>', cut)
+            if close != -1:
+                cut = close + 1
+        if cut < len(text):
+            text = text[:cut] + "..."
+    return escape_md(text, user_map)
 
 
 def is_jira_comment_message(msg):
     return (
         msg.get("user") == "Jira Cloud"
-        and JIRA_COMMENT_RE.fullmatch(msg.get("text", "").strip())
+        and JIRA_COMMENT_RE.fullmatch(msg.get("text", ""))
     )
 
-def json_to_markdown(data, filter_jira_comments=False):
-    lines = ["## Slack Channel Transcript\n"]
+def json_to_markdown(data, out_fp, filter_jira_comments=False, user_map=None):
+    """Write the Markdown transcript for data to out_fp one message at a time."""
+    out_fp.write("## Slack Channel Transcript\n\n")
 
     for entry in data:
         if filter_jira_comments and is_jira_comment_message(entry):
@@ -290,25 +467,34 @@ def json_to_markdown(data, filter_jira_comments=False):
 
         user = entry.get("user", "Unknown")
         time_str = format_timestamp(entry.get("timestamp"))
-        text = escape_md(entry.get("text", "").strip())
-        text = truncate(text, MAX_MSG_LENGTH)
+        text = prepare_text(entry.get("text", ""), user_map)
 
-        lines.append(f"**{user}** ({time_str}):\n> {text}\n")
+        out_fp.write(f"**{user}** ({time_str}):\n> {text}\n\n")
 
         for reply in entry.get("thread", []):
+            if filter_jira_comments and is_jira_comment_message(reply):
+                continue
+
             reply_user = reply.get("user", "Unknown")
             reply_time = format_timestamp(reply.get("timestamp"))
-            reply_text = escape_md(reply.get("text", "").strip())
-            reply_text = truncate(reply_text, MAX_MSG_LENGTH)
+            reply_text = prepare_text(reply.get("text", ""), user_map)
 
-            lines.append(f"  **{reply_user}** ({reply_time}):\n  > {reply_text}\n")
+            out_fp.write(f"  **{reply_user}** ({reply_time}):\n  > {reply_text}\n\n")
 
-        lines.append("---\n")
+        out_fp.write("---\n\n")
 
-    return "\n".join(lines)
+def write_json(entries, f):
+    """Pass entries through unchanged while writing them to f as JSON Lines, one entry per line."""
+    for entry in entries:
+        # json.dumps without indent uses the C encoder; json.dump and indent fall back to pure Python
+        f.write(json.dumps(entry, ensure_ascii=False))
+        f.write("\n")
+        yield entry
 
 def calculate_oldest_timestamp(days):
-    return str(int(time.time() - days * 24 * 60 * 60))
+    # Round down to the start of the day so reruns share cached history pages
+    day = 24 * 60 * 60
+    return str(int(time.time()) // day * day - days * day)
 
 def main():
     parser = argparse.ArgumentParser(description="Export Slack channel history to Markdown")
@@ -316,8 +502,9 @@ def main():
     parser.add_argument("--days", type=int, default=365*2, help="Number of days to look back (default: 730 days/2 years)")
     parser.add_argument("--output", "-o", help="Output file path (default: based on channel name)")
     parser.add_argument("--filter-jira-comments", action="store_true", help="Filter out Jira Cloud comment notifications")
-    parser.add_argument("--json", help="Also save the intermediate JSON representation to this path")
+    parser.add_argument("--json", help="Also save the intermediate data as JSON Lines to this path (gzip-compressed if it ends in .gz)")
     parser.add_argument("--refresh-users", action="store_true", help="Force refresh user data instead of using cached data")
+    parser.add_argument("--refresh-messages", action="store_true", help="Force refresh message history instead of using cached pages")
     args = parser.parse_args()
     
     try:
@@ -334,26 +521,42 @@ def main():
             output_filename = f"slack_export_{channel_name}.md"
         
         # Get user map (from cache or API)
-        user_map = fetch_user_map(force_refresh=args.refresh_users)
-        
-        # Fetch and structure messages
-        messages = fetch_channel_messages(channel_id, oldest_timestamp)
-        structured = structure_messages(messages, user_map, channel_id)
+        user_map = UserMap(fetch_user_map(force_refresh=args.refresh_users))
         
-        # Save JSON if requested
-        if args.json:
-            json_filename = args.json
-            with open(json_filename, 'w', encoding='utf-8') as f:
-                json.dump(list(reversed(structured)), f, indent=2, ensure_ascii=False)
-            print(f"💾 JSON data saved to {json_filename}")
-            
-        # Convert to markdown and save
-        markdown = json_to_markdown(list(reversed(structured)), filter_jira_comments=args.filter_jira_comments)
-        
-        with open(output_filename, 'w', encoding='utf-8') as f:
-            f.write(markdown)
-
-        print(f"✅ Export complete! {len(structured)} top-level messages saved to {output_filename}")
+        # Spool history to disk, then structure and write it out in a single streaming pass
+        fd, spool_path = tempfile.mkstemp(prefix="slackdown-", suffix=".jsonl")
+        os.close(fd)
+        # Thread replies are fetched in the background while history is still paginating. History
+        # stays on disk, but replies are held in memory until their parent is structured, so peak
+        # memory grows with the channel's total reply volume rather than staying at one page.
+        executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        threads = {}
+        try:
+            total = fetch_channel_messages(
+                channel_id, oldest_timestamp, spool_path,
+                force_refresh=args.refresh_messages,
+                on_page=functools.partial(prefetch_threads, executor, channel_id, threads),
+            )
+            entries = structure_messages(spool_path, user_map, threads)
+
+            with ExitStack() as stack:
+                # Save JSON if requested
+                if args.json:
+                    json_open = gzip.open if args.json.endswith(".gz") else open
+                    json_file = stack.enter_context(json_open(args.json, 'wt', encoding='utf-8'))
+                    entries = write_json(entries, json_file)
+
+                # Convert to markdown and save
+                with open(output_filename, 'w', encoding='utf-8') as f:
+                    json_to_markdown(entries, f, filter_jira_comments=args.filter_jira_comments, user_map=user_map)
+
+            if args.json:
+                print(f"💾 JSON data saved to {args.json}")
+        finally:
+            executor.shutdown(cancel_futures=True)
+            os.remove(spool_path)
+
+        print(f"✅ Export complete! {total} top-level messages saved to {output_filename}")
 
     except Exception as e:
         print("💥 An error occurred:", str(e))